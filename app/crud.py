@@ -1,61 +1,144 @@
-from sqlalchemy import select, text  # Import SQLAlchemy utilities for queries and raw SQL execution
+from sqlalchemy import select, insert, update, delete, text, func, lambda_stmt  # Import SQLAlchemy utilities for queries and raw SQL execution
+from sqlalchemy.orm import raiseload  # Turn accidental lazy loads into errors
 from sqlalchemy.ext.asyncio import AsyncSession  # Import asynchronous database session
+from cachetools import TTLCache  # In-process cache with time-based expiry
 from . import models, schemas  # Import ORM models and Pydantic schemas
 from typing import Optional  # For optional return types
-from datetime import datetime  # For handling timestamps
+
+# In-process cache for single-task reads, keyed by task id
+# Entries expire after 30 seconds and are evicted on any write to the
+# task, so a hit skips the database round-trip entirely. Cached objects
+# are detached Task instances (safe because expire_on_commit=False).
+TASK_CACHE = TTLCache(maxsize=10_000, ttl=30)
+
+# Precompiled base statement for listing tasks
+# lambda_stmt caches the compiled SQL, so repeated calls skip the
+# Core-to-SQL compilation step and only bind new parameter values.
+# Individual columns are selected instead of the Task entity so the list
+# path skips ORM instance construction and identity-map bookkeeping; the
+# rows are serialized straight from mappings.
+GET_TASKS_STMT = lambda_stmt(
+    lambda: select(
+        models.Task.id,
+        models.Task.title,
+        models.Task.description,
+        models.Task.completed,
+        models.Task.created_at,
+        models.Task.updated_at,
+        func.count().over().label("total")  # Total count alongside the page rows
+    )
+    .order_by(models.Task.id)  # Deterministic order so pages never repeat or skip rows
+)
 
 # Create Task
 async def create_task(db: AsyncSession, task: schemas.TaskCreate) -> models.Task:
     """
     Create a new task in the database.
     - Accepts a TaskCreate schema and inserts it into the database.
-    - Sets created_at and updated_at timestamps.
+    - Timestamps are set by the database via server defaults.
+    - Uses INSERT..RETURNING to create and load the task in one round-trip.
     """
-    db_task = models.Task(**task.model_dump())  # Map schema data to the Task model
-    db_task.created_at = datetime.utcnow()  # Set creation timestamp
-    db_task.updated_at = datetime.utcnow()  # Set update timestamp
-    db.add(db_task)  # Add the task to the session
+    stmt = (
+        insert(models.Task)
+        .values(**task.model_dump())  # Map schema data to the Task columns
+        .returning(models.Task)  # Return the inserted row without a separate SELECT
+    )
+    result = await db.execute(stmt)  # Execute the insert
+    db_task = result.scalar_one()  # Fetch the newly created task
     await db.commit()  # Commit the transaction
-    await db.refresh(db_task)  # Refresh the task instance with the latest data
     return db_task  # Return the created task
 
+# Batches at or above this size use asyncpg COPY instead of INSERT
+COPY_THRESHOLD = 100
+
+# Bulk create tasks
+async def bulk_create_tasks(db: AsyncSession, tasks: list[schemas.TaskCreate]) -> int:
+    """
+    Create multiple tasks in a single batch.
+    - Uses a batched multi-row INSERT for small batches.
+    - Uses asyncpg's native COPY protocol for large batches, which avoids
+      per-row statement overhead and does a single WAL flush.
+    - Returns the number of tasks created.
+    """
+    if not tasks:
+        return 0  # Nothing to insert
+    if len(tasks) < COPY_THRESHOLD:
+        # Small batch: one multi-row INSERT via executemany
+        await db.execute(
+            insert(models.Task),
+            [task.model_dump() for task in tasks]
+        )
+    else:
+        # Large batch: stream the rows through COPY on the raw asyncpg connection
+        # Timestamp columns are omitted so their server defaults apply.
+        connection = await db.connection()  # Connection bound to the session's transaction
+        raw_connection = await connection.get_raw_connection()  # Underlying DBAPI connection
+        await raw_connection.driver_connection.copy_records_to_table(
+            "tasks",
+            records=[(task.title, task.description, False) for task in tasks],
+            columns=["title", "description", "completed"]
+        )
+    await db.commit()  # Commit the transaction
+    return len(tasks)  # Return the number of tasks created
+
 # Read single task
 async def get_task(db: AsyncSession, task_id: int) -> Optional[models.Task]:
     """
     Retrieve a single task by its ID.
     - Returns the task if found, otherwise None.
+    - Uses session.get() for the primary-key lookup, which avoids query
+      compilation and can hit the identity map.
+    - Serves repeat reads from TASK_CACHE without touching the database.
+    - Loads with raiseload('*') so any relationship added to Task later
+      must be loaded eagerly here (selectinload etc.) instead of firing
+      silent lazy SELECTs during serialization.
     """
-    result = await db.execute(
-        select(models.Task).filter(models.Task.id == task_id)  # Query for the task by ID
-    )
-    return result.scalars().first()  # Return the first result or None
+    db_task = TASK_CACHE.get(task_id)  # Check the in-process cache first
+    if db_task is not None:
+        return db_task  # Cache hit, no database round-trip
+    db_task = await db.get(models.Task, task_id, options=[raiseload("*")])  # Look up the task by primary key
+    if db_task is not None:
+        TASK_CACHE[task_id] = db_task  # Cache the task for subsequent reads
+    return db_task
 
 # Read all tasks
 async def get_tasks(db: AsyncSession, skip: int = 0, limit: int = 100):
     """
     Retrieve all tasks with pagination.
     - Supports skipping and limiting the number of results.
+    - Returns a (tasks, total) tuple, where total is the full table count
+      computed with a window function in the same query as the page.
+    - Reuses the precompiled GET_TASKS_STMT to skip statement compilation.
+    - Returns plain row mappings rather than ORM instances, which skips
+      ORM hydration; Pydantic serializes the mappings directly.
     """
-    result = await db.execute(
-        select(models.Task).offset(skip).limit(limit)  # Query with pagination
-    )
-    return result.scalars().all()  # Return all matching tasks as a list
+    stmt = GET_TASKS_STMT + (lambda s: s.offset(skip).limit(limit))  # Add pagination as cached lambda elements
+    result = await db.execute(stmt)
+    rows = result.mappings().all()  # Materialize the page as column mappings
+    total = rows[0]["total"] if rows else 0  # Total row count from the window function
+    return rows, total  # Return the page of tasks and the total count
 
 # Update task
 async def update_task(db: AsyncSession, task_id: int, task_update: schemas.TaskUpdate) -> Optional[models.Task]:
     """
     Update an existing task by its ID.
     - Accepts a TaskUpdate schema and updates only the provided fields.
-    - Updates the updated_at timestamp.
+    - The updated_at timestamp is bumped by the column's onupdate default.
+    - Uses a single UPDATE..RETURNING instead of SELECT + UPDATE + refresh.
     """
-    db_task = await get_task(db, task_id)  # Retrieve the task by ID
-    if db_task:
-        update_data = task_update.model_dump(exclude_unset=True)  # Get only the fields to update
-        for key, value in update_data.items():
-            setattr(db_task, key, value)  # Update the task fields
-        db_task.updated_at = datetime.utcnow()  # Update the timestamp
-        await db.commit()  # Commit the transaction
-        await db.refresh(db_task)  # Refresh the task instance with the latest data
+    update_data = task_update.model_dump(exclude_unset=True)  # Get only the fields to update
+    if not update_data:
+        return await get_task(db, task_id)  # Nothing to update, just return the task
+    stmt = (
+        update(models.Task)
+        .where(models.Task.id == task_id)  # Target the task by ID
+        .values(**update_data)  # Apply the changes; updated_at is set DB-side
+        .returning(models.Task)  # Return the updated row without a separate SELECT
+    )
+    result = await db.execute(stmt)  # Execute the update
+    db_task = result.scalar_one_or_none()  # Fetch the updated task, or None if not found
+    await db.commit()  # Commit the transaction
+    TASK_CACHE.pop(task_id, None)  # Drop any cached copy of the old task
     return db_task  # Return the updated task or None if not found
 
 # Delete task
@@ -63,19 +146,27 @@ async def delete_task(db: AsyncSession, task_id: int) -> bool:
     """
     Delete a task by its ID.
     - Returns True if the task was deleted, otherwise False.
+    - Uses a single DELETE..RETURNING instead of SELECT then DELETE.
     """
-    db_task = await get_task(db, task_id)  # Retrieve the task by ID
-    if db_task:
-        await db.delete(db_task)  # Delete the task
-        await db.commit()  # Commit the transaction
-        return True  # Task was deleted
-    return False  # Task not found
+    stmt = (
+        delete(models.Task)
+        .where(models.Task.id == task_id)  # Target the task by ID
+        .returning(models.Task.id)  # Returns the id only when a row was deleted
+    )
+    result = await db.execute(stmt)  # Execute the delete
+    deleted = result.scalar_one_or_none() is not None  # True if a row was deleted
+    await db.commit()  # Commit the transaction
+    TASK_CACHE.pop(task_id, None)  # Drop any cached copy of the task
+    return deleted  # Whether the task existed and was deleted
 
-# Reset task ID sequence
-async def reset_task_id_sequence(db: AsyncSession):
+# Delete all tasks and reset the ID sequence
+async def reset_tasks(db: AsyncSession):
     """
-    Reset the ID sequence for the tasks table.
-    - Ensures new tasks start with ID 1 after all tasks are deleted.
+    Delete all tasks and reset the ID sequence.
+    - Uses TRUNCATE with RESTART IDENTITY to empty the table and reset the
+      sequence in a single statement.
+    - Ensures new tasks start with ID 1.
     """
-    await db.execute(text("ALTER SEQUENCE tasks_id_seq RESTART WITH 1"))  # Reset the sequence
-    await db.commit()  # Commit the transaction
\ No newline at end of file
+    await db.execute(text("TRUNCATE TABLE tasks RESTART IDENTITY"))  # Empty the table and reset the sequence
+    await db.commit()  # Commit the transaction
+    TASK_CACHE.clear()  # Every cached task is now gone
\ No newline at end of file
@@ -1,7 +1,7 @@
 import os
 from dotenv import load_dotenv  # Load environment variables from a .env file
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession  # Async database engine and session
-from sqlalchemy.orm import sessionmaker, declarative_base  # ORM utilities
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession  # Async database engine and session
+from sqlalchemy.orm import declarative_base  # ORM utilities
 from typing import AsyncGenerator  # Type hint for async generator
 
 # Load environment variables from the .env file
@@ -10,21 +10,37 @@ load_dotenv()
 # Database connection URL from environment variables
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Ensure the asyncpg driver is used even if the URL omits it
+if DATABASE_URL and DATABASE_URL.startswith("postgresql://"):
+    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
 # Create an asynchronous database engine
 engine = create_async_engine(
     DATABASE_URL,  # Database connection string
-    echo=True,  # Enable SQL query logging
-    pool_size=10,  # Number of connections in the pool
-    max_overflow=20,  # Maximum number of connections beyond the pool size
+    echo=os.getenv("SQL_ECHO", "0") == "1",  # SQL query logging, off by default (set SQL_ECHO=1 to enable)
+    echo_pool=False,  # Disable connection pool logging
+    pool_pre_ping=True,  # Check connections for liveness before handing them out
+    pool_size=20,  # Number of connections in the pool
+    max_overflow=40,  # Maximum number of connections beyond the pool size
     pool_timeout=30,  # Timeout for acquiring a connection
-    pool_recycle=3600  # Recycle connections after this many seconds
+    pool_recycle=1800,  # Recycle connections after this many seconds
+    connect_args={
+        "statement_cache_size": 200,  # asyncpg's per-connection statement cache
+        "prepared_statement_cache_size": 200,  # Keep hot statements prepared across requests
+        "server_settings": {
+            "jit": "off",  # JIT compilation only hurts the short queries this app runs
+            "tcp_keepalives_idle": "60",  # Seconds of idle before sending keepalive probes
+            "tcp_keepalives_interval": "30",  # Seconds between keepalive probes
+            "tcp_keepalives_count": "3"  # Probes before the connection is considered dead
+        }
+    }
 )
 
 # Create a session factory for database interactions
-SessionLocal = sessionmaker(
-    bind=engine,  # Bind the session to the async engine
-    class_=AsyncSession,  # Use asynchronous sessions
-    expire_on_commit=False  # Prevent automatic expiration of objects after commit
+SessionLocal = async_sessionmaker(
+    engine,  # Bind the session to the async engine
+    expire_on_commit=False,  # Prevent automatic expiration of objects after commit
+    autoflush=False  # CRUD functions commit explicitly, so skip autoflush checks on every execute
 )
 
 # Base class for ORM models
@@ -36,6 +52,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Provides a database session for FastAPI routes.
     - Yields an AsyncSession instance.
     - Ensures the session is properly closed after use.
+    - This is the single session (and pooled connection) for the whole
+      request scope: routes pass it to every CRUD call rather than
+      acquiring their own, so each request costs one pool checkout.
     """
     async with SessionLocal() as session:
         yield session
\ No newline at end of file
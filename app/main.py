@@ -1,27 +1,30 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse  # Fast JSON responses backed by orjson
+from fastapi.middleware.gzip import GZipMiddleware  # Compress large responses
 from .routers import tasks  # Import the tasks router
-from .database import engine, Base  # Import database engine and Base for ORM
-from contextlib import asynccontextmanager  # Import async context manager for lifespan
 
-# Define the lifespan of the application
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """
-    Lifespan function to handle application startup and shutdown events.
-    - Creates all database tables on startup.
-    """
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)  # Create database tables
-    yield  # Yield control back to the application
+# Use uvloop as the event loop when available (not supported on Windows)
+# Its libuv-based scheduler has lower per-await overhead than the
+# default asyncio loop, which benefits every async endpoint.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 # Initialize the FastAPI application
+# Database tables are created by the create_tables.py script, not at
+# startup, so the app serves its first request without running DDL checks.
 app = FastAPI(
     title="To-Do API",  # Title of the API
     description="A complete To-Do application with FastAPI and PostgreSQL",  # Description of the API
     version="1.0.0",  # Version of the API
-    lifespan=lifespan  # Attach the lifespan function
+    default_response_class=ORJSONResponse  # Serialize responses with orjson
 )
 
+# Compress responses larger than 500 bytes (mainly task list pages)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Include the tasks router
 app.include_router(tasks.router)  # Add the tasks endpoints to the application
 
@@ -7,6 +7,10 @@ class Task(Base):
     __tablename__ = "tasks"  # Name of the database table
     __table_args__ = (
         Index('ix_task_completed', 'completed'),  # Index on the 'completed' column for faster queries
+        Index(
+            'ix_tasks_completed_id', 'completed', 'id',  # Composite index for filtered, ordered list pages
+            postgresql_include=['title', 'updated_at']  # Covered columns enable index-only scans
+        ),
     )
 
     # Columns in the tasks table
@@ -15,4 +19,4 @@ class Task(Base):
     description = Column(String(500))  # Task description, optional, max length 500 characters
     completed = Column(Boolean, default=False)  # Boolean flag for task completion, defaults to False
     created_at = Column(DateTime(timezone=True), server_default=func.now())  # Auto-set timestamp when task is created
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())  # Auto-update timestamp when task is modified
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())  # Auto-set on create, auto-update on modify
\ No newline at end of file
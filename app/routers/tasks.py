@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status  # FastAPI utilities for routing and dependency injection
 from sqlalchemy.ext.asyncio import AsyncSession  # Async database session
-from sqlalchemy import text  # For executing raw SQL queries
 from typing import List  # Type hint for lists
 from .. import schemas, crud  # Import schemas and CRUD operations
 from ..database import get_db  # Dependency to get the database session
@@ -28,6 +27,22 @@ async def create_task(task: schemas.TaskCreate, db: AsyncSession = Depends(get_d
     """
     return await crud.create_task(db, task)  # Call the create_task function from CRUD
 
+# Endpoint to create multiple tasks in one batch
+@router.post(
+    "/bulk",
+    response_model=schemas.TaskBulkCreateResponse,  # Response schema with the created count
+    status_code=status.HTTP_201_CREATED,  # HTTP status code for successful creation
+    summary="Create multiple tasks"  # Short description for API documentation
+)
+async def bulk_create_tasks(tasks: List[schemas.TaskCreate], db: AsyncSession = Depends(get_db)):
+    """
+    Create multiple tasks in a single request:
+    - Accepts a JSON list of tasks with **title** and optional **description**.
+    - Large batches are streamed to the database with COPY for speed.
+    """
+    created = await crud.bulk_create_tasks(db, tasks)  # Call the bulk_create_tasks function from CRUD
+    return {"created": created}  # Return the number of tasks created
+
 # Endpoint to list all tasks with pagination
 @router.get(
     "/",
@@ -40,8 +55,8 @@ async def list_tasks(skip: int = 0, limit: int = 100, db: AsyncSession = Depends
     - **skip**: Number of tasks to skip (for pagination)
     - **limit**: Maximum number of tasks to return
     """
-    tasks = await crud.get_tasks(db, skip=skip, limit=limit)  # Call the get_tasks function from CRUD
-    return {"tasks": tasks, "count": len(tasks)}  # Return tasks and their count
+    tasks, total = await crud.get_tasks(db, skip=skip, limit=limit)  # Call the get_tasks function from CRUD
+    return {"tasks": tasks, "count": total}  # Return the page of tasks and the total count
 
 # Endpoint to delete all tasks and reset the ID sequence
 @router.delete(
@@ -53,8 +68,7 @@ async def reset_tasks(db: AsyncSession = Depends(get_db)):
     """
     Delete all tasks and reset the ID sequence.
     """
-    await db.execute(text("DELETE FROM tasks"))  # Delete all tasks from the database
-    await crud.reset_task_id_sequence(db)  # Reset the ID sequence
+    await crud.reset_tasks(db)  # Truncate the table and reset the ID sequence
     return None
 
 # Endpoint to retrieve a single task by its ID
@@ -104,16 +118,12 @@ async def patch_task(task_id: int, task: schemas.TaskUpdate, db: AsyncSession =
     """
     Partially update a task (only the provided fields will be updated).
     """
-    existing_task = await crud.get_task(db, task_id=task_id)  # Call the get_task function from CRUD
-    if not existing_task:
+    updated_task = await crud.update_task(db, task_id=task_id, task_update=task)  # Fused UPDATE..RETURNING handles partial updates
+    if not updated_task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,  # HTTP status code for not found
             detail="Task not found"  # Error message
         )
-    
-    # Update only the fields that were provided
-    update_data = task.dict(exclude_unset=True)
-    updated_task = await crud.update_task(db, task_id=task_id, task_update=schemas.TaskUpdate(**update_data))  # Call the update_task function from CRUD
     return updated_task
 
 # Endpoint to delete a task by its ID
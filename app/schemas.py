@@ -1,4 +1,4 @@
-from pydantic import BaseModel  # Base class for Pydantic models
+from pydantic import BaseModel, ConfigDict  # Base class and config for Pydantic models
 from typing import Optional, List  # Type hints for optional and list fields
 from datetime import datetime  # For datetime fields
 
@@ -21,15 +21,18 @@ class TaskUpdate(BaseModel):
 
 # Schema for returning a single task
 class TaskResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)  # Allow validation from SQLAlchemy models (Pydantic v2)
+
     id: int  # Task ID
     title: str  # Task title
-    description: str  # Task description
+    description: Optional[str] = None  # Task description, nullable in the database
     completed: bool  # Task completion status
     created_at: datetime  # Timestamp when the task was created
     updated_at: datetime  # Timestamp when the task was last updated
 
-    class Config:
-        orm_mode = True  # Enable ORM mode for compatibility with SQLAlchemy models
+# Schema for the bulk create response
+class TaskBulkCreateResponse(BaseModel):
+    created: int  # Number of tasks created
 
 # Schema for listing multiple tasks
 class TaskListResponse(BaseModel):